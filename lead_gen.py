@@ -5,13 +5,17 @@ Leads scraper for Google Maps Places (official googlemaps client)
 Features
 - Loads API key from .env (GOOGLE_MAPS_API_KEY), config.ini, or environment var
 - Text Search with pagination (handles next_page_token properly)
-- Place Details with cost-controlled fields
+- Place Details with cost-controlled fields (thread pool, or asyncio + aiohttp with --async)
 - Robust error handling (timeouts, API errors, no results)
 - CSV + JSON output with dynamic, human-readable filenames
 - Simple CLI: python leads_scraper.py --query "Generator Dealer" --location "Atlanta, GA" --radius 5000
 
 Install:
     pip install googlemaps python-dotenv
+    pip install aiohttp   # optional, for --async
+    pip install orjson    # faster JSON output/cache (in requirements.txt; optional locally)
+    pip install tqdm      # optional, progress bar for Place Details
+    pip install zstandard # compressed details cache (in requirements.txt; optional locally)
 
 Notes:
 - Ensure your Google Cloud project has Places API enabled.
@@ -19,23 +23,103 @@ Notes:
 """
 
 import argparse
+import asyncio
 import configparser
 import csv
+import hashlib
 import json
+import math
 import os
 import re
+import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import closing
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import googlemaps
 from googlemaps import exceptions as gme
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    # aiohttp is optional; without it the async Details backend falls back to threads
+    aiohttp = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    # orjson is optional; without it JSON output uses the stdlib encoder
+    orjson = None
+
+try:
+    from tqdm import tqdm  # type: ignore
+except ImportError:
+    # tqdm is optional; without it progress is printed every PROGRESS_EVERY places
+    tqdm = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    # zstandard is optional; without it details cache entries are stored as plain JSON
+    zstandard = None
 
 # -------------------------------
 # 1) Configuration and Setup
 # -------------------------------
 
+# Parallel Place Details requests in flight per search.
+DEFAULT_DETAIL_CONCURRENCY = 8
+
+# Keep-alive HTTPS connections held by the shared googlemaps client session.
+# detail_concurrency must stay <= HTTP_POOL_SIZE, or workers queue for a free connection.
+HTTP_POOL_SIZE = 32
+
+# Retries (with exponential backoff from HTTP_RETRY_BACKOFF seconds) on rate-limit/server errors,
+# applied by both Details backends.
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Fallback progress line is refreshed once per this many completed Details calls.
+PROGRESS_EVERY = 10
+
+# Upper bound on Place Details requests per second for the whole process, shared by all
+# concurrent searches and both backends (keep below the project quota).
+PLACES_QPS = 45.0
+# Requests that may go out back-to-back before pacing to PLACES_QPS kicks in.
+PLACES_BURST = 10
+
+# Async Details backend: raw Place Details endpoint and socket pool size.
+PLACE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+ASYNC_CONNECTION_LIMIT = 32
+
+# Text normalizing patterns (cache keys, filenames), compiled once at import.
+_WS_RE = re.compile(r"\s+")
+_NONALNUM_RE = re.compile(r"[^A-Za-z0-9_]+")
+_DUP_US_RE = re.compile(r"_+")
+
+# On-disk cache of geocoded locations (shared by CLI runs and Streamlit sessions).
+GEOCODE_CACHE_PATH = "_geocode_cache.sqlite"
+_GEOCODE_DDL = "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, lat REAL, lng REAL, ts INTEGER)"
+
+# On-disk cache of sanitized leads per (place_id, fields) so overlapping searches skip Details calls.
+DETAILS_CACHE_PATH = "_details_cache.sqlite"
+DETAILS_CACHE_TTL_SECONDS = 30 * 24 * 3600
+_DETAILS_DDL = (
+    "CREATE TABLE IF NOT EXISTS details "
+    "(pid TEXT, fhash TEXT, json BLOB, ts INTEGER, PRIMARY KEY (pid, fhash))"
+)
+# Details cache blobs are zstd-compressed JSON (when zstandard is installed); the magic marks them.
+DETAILS_CACHE_ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
 def load_api_key() -> Optional[str]:
     """
     Load API key from (in order of precedence):
@@ -71,32 +155,290 @@ def load_api_key() -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=1)
 def init_client(api_key: str) -> googlemaps.Client:
     """
     Initialize and return a googlemaps.Client instance.
+    The client is cached per api_key for the life of the process (CLI run or Streamlit server),
+    so every search reuses the same warm HTTPS connection pool.
     Raises ValueError if api_key is empty.
     """
     if not api_key:
         raise ValueError("Empty API key provided to init_client().")
     # You can tweak timeout or retry logic here if needed.
-    return googlemaps.Client(key=api_key, timeout=10)
+    client = googlemaps.Client(key=api_key, timeout=10, retry_over_query_limit=True)
+    # Default pool keeps only 10 connections; size it for the Details thread pool,
+    # and let urllib3 back off and retry on 429/5xx responses.
+    retries = Retry(
+        total=HTTP_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF, status_forcelist=list(HTTP_RETRY_STATUSES)
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries
+    )
+    client.session.mount("https://", adapter)
+    return client
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket shared by both Details backends: refills at `qps` tokens per second
+    and holds up to `burst`, so idle time is banked and short bursts go out immediately while the
+    steady-state rate never exceeds `qps`. Only the token accounting is serialized; callers sleep
+    outside the lock (sync via wait(), asyncio via wait_async()).
+    """
+
+    def __init__(self, qps: float, burst: int = 1):
+        self._rate = qps
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token (possibly going into debt) and return how long the caller must wait for it."""
+        if self._rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1.0
+            tokens = self._tokens
+        return -tokens / self._rate if tokens < 0 else 0.0
+
+    def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Process-wide Details rate limiter: Google's QPS quota is per project, so concurrent searches
+# (e.g. several Streamlit sessions) must draw from one bucket.
+_PLACES_LIMITER = _RateLimiter(PLACES_QPS, PLACES_BURST)
 
 
 # -------------------------------
 # 2) Core Logic and Search
 # -------------------------------
 
+def _open_cache(path: str, ddl: str) -> sqlite3.Connection:
+    """
+    Open (and create if needed) a small SQLite cache file with the given table DDL.
+    """
+    conn = sqlite3.connect(path, timeout=5)
+    conn.execute(ddl)
+    return conn
+
+
+def _normalize_location_key(location: str) -> str:
+    """Cache key for a location string: trimmed, lower-cased, single-spaced."""
+    return _WS_RE.sub(" ", location.strip().lower())
+
+
+def _geocode_cache_get(key: str) -> Optional[Tuple[float, float]]:
+    """Return cached (lat, lng) for key, or None on miss / unreadable cache."""
+    try:
+        with closing(_open_cache(GEOCODE_CACHE_PATH, _GEOCODE_DDL)) as conn:
+            row = conn.execute("SELECT lat, lng FROM cache WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error as e:
+        print(f"[warn] Geocode cache read failed: {e}", file=sys.stderr)
+        return None
+    return (row[0], row[1]) if row else None
+
+
+def _geocode_cache_set(key: str, lat: float, lng: float) -> None:
+    """Store (lat, lng) for key; cache write failures are logged and ignored."""
+    try:
+        with closing(_open_cache(GEOCODE_CACHE_PATH, _GEOCODE_DDL)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, lat, lng, ts) VALUES (?, ?, ?, ?)",
+                (key, lat, lng, int(time.time())),
+            )
+    except sqlite3.Error as e:
+        print(f"[warn] Geocode cache write failed: {e}", file=sys.stderr)
+
+
+def _fields_hash(fields: List[str]) -> str:
+    """Short, order-independent digest of a Details field list (part of the details cache key)."""
+    return hashlib.blake2b("|".join(sorted(fields)).encode(), digest_size=8).hexdigest()
+
+
+def _encode_blob(obj: Dict, cctx: Optional["zstandard.ZstdCompressor"]) -> bytes:
+    """Serialize a cache entry to JSON bytes, zstd-compressed when a compressor is given."""
+    raw = orjson.dumps(obj) if orjson is not None else json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    return cctx.compress(raw) if cctx is not None else raw
+
+
+def _decode_blob(blob, dctx: Optional["zstandard.ZstdDecompressor"]) -> Dict:
+    """
+    Inverse of _encode_blob(). Also reads plain JSON entries (TEXT or uncompressed BLOB).
+    Raises ValueError for compressed entries when zstandard is not installed.
+    """
+    if isinstance(blob, str):
+        blob = blob.encode("utf-8")
+    if blob[:4] == _ZSTD_MAGIC:
+        if dctx is None:
+            raise ValueError("entry is zstd-compressed but zstandard is not installed")
+        blob = dctx.decompress(blob)
+    return orjson.loads(blob) if orjson is not None else json.loads(blob)
+
+
+# In-memory mirror of the details cache: (pid, fhash) -> (ts, lead).
+# Loaded in one bulk read on first use, then kept in sync by _details_cache_put_many().
+_details_memo: Optional[Dict[Tuple[str, str], Tuple[int, Dict]]] = None
+_details_memo_lock = threading.Lock()
+
+
+def _details_memo_load() -> Dict[Tuple[str, str], Tuple[int, Dict]]:
+    """
+    Return the in-memory details cache, bulk-loading all fresh entries from disk the first time.
+    An unreadable cache file (or undecodable entries) just means fewer hits.
+    """
+    global _details_memo
+    with _details_memo_lock:
+        if _details_memo is not None:
+            return _details_memo
+
+        memo: Dict[Tuple[str, str], Tuple[int, Dict]] = {}
+        cutoff = int(time.time()) - DETAILS_CACHE_TTL_SECONDS
+        dctx = zstandard.ZstdDecompressor() if zstandard is not None else None
+        try:
+            with closing(_open_cache(DETAILS_CACHE_PATH, _DETAILS_DDL)) as conn:
+                rows = conn.execute(
+                    "SELECT pid, fhash, json, ts FROM details WHERE ts >= ?", (cutoff,)
+                )
+                for pid, fhash, blob, ts in rows:
+                    try:
+                        memo[(pid, fhash)] = (ts, _decode_blob(blob, dctx))
+                    except Exception:
+                        continue
+        except sqlite3.Error as e:
+            print(f"[warn] Details cache read failed: {e}", file=sys.stderr)
+
+        _details_memo = memo
+        return memo
+
+
+def _details_cache_get_many(pids: List[str], fhash: str) -> Dict[str, Dict]:
+    """
+    Return {place_id: lead} for every pid with a fresh (within DETAILS_CACHE_TTL_SECONDS) cached lead.
+    Stale entries found along the way are dropped from the in-memory mirror.
+    """
+    memo = _details_memo_load()
+    cutoff = int(time.time()) - DETAILS_CACHE_TTL_SECONDS
+    hits: Dict[str, Dict] = {}
+    with _details_memo_lock:
+        for pid in pids:
+            entry = memo.get((pid, fhash))
+            if entry is None:
+                continue
+            if entry[0] >= cutoff:
+                hits[pid] = entry[1]
+            else:
+                del memo[(pid, fhash)]
+    return hits
+
+
+def _details_cache_put_many(leads: List[Dict], fhash: str) -> None:
+    """
+    Store freshly fetched leads in one transaction, evicting entries older than
+    DETAILS_CACHE_TTL_SECONDS from both the file and the in-memory mirror so neither grows unbounded.
+    Cache write failures are logged and ignored.
+    """
+    if not leads:
+        return
+    now = int(time.time())
+    cutoff = now - DETAILS_CACHE_TTL_SECONDS
+    cctx = zstandard.ZstdCompressor(level=DETAILS_CACHE_ZSTD_LEVEL) if zstandard is not None else None
+    rows = [(lead["place_id"], fhash, _encode_blob(lead, cctx), now) for lead in leads]
+
+    memo = _details_memo_load()
+    with _details_memo_lock:
+        for k in [k for k, (ts, _) in memo.items() if ts < cutoff]:
+            del memo[k]
+        for lead in leads:
+            memo[(lead["place_id"], fhash)] = (now, lead)
+
+    try:
+        with closing(_open_cache(DETAILS_CACHE_PATH, _DETAILS_DDL)) as conn, conn:
+            conn.execute("DELETE FROM details WHERE ts < ?", (cutoff,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO details (pid, fhash, json, ts) VALUES (?, ?, ?, ?)", rows
+            )
+    except sqlite3.Error as e:
+        print(f"[warn] Details cache write failed: {e}", file=sys.stderr)
+
+
+class _NoGeocodeResult(Exception):
+    """Raised inside the cached lookup so empty results are not memoized."""
+
+
+# Geocoding calls currently in flight, keyed by normalized location (see _geocode_lookup).
+_geocode_inflight: Dict[str, "Future[Tuple[float, float]]"] = {}
+_geocode_inflight_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def _geocode_lookup(gmaps: googlemaps.Client, key: str) -> Tuple[float, float]:
+    """
+    Resolve a normalized location key via the on-disk cache, falling back to the Geocoding API.
+    Raises _NoGeocodeResult when the API has no results (failures are never memoized).
+    Concurrent misses for the same key wait on a single in-flight API call instead of racing.
+    """
+    hit = _geocode_cache_get(key)
+    if hit:
+        return hit
+
+    # Singleflight: concurrent misses for the same key share one API call.
+    with _geocode_inflight_lock:
+        fut = _geocode_inflight.get(key)
+        leader = fut is None
+        if leader:
+            fut = Future()
+            _geocode_inflight[key] = fut
+    if not leader:
+        return fut.result()
+
+    try:
+        # Double-checked lookup: a previous leader may have stored the result (and left the
+        # in-flight map) between our cache miss above and taking the lock.
+        hit = _geocode_cache_get(key)
+        fut.set_result(hit if hit else _geocode_api(gmaps, key))
+    except BaseException as e:
+        fut.set_exception(e)
+    finally:
+        with _geocode_inflight_lock:
+            _geocode_inflight.pop(key, None)
+    return fut.result()
+
+
+def _geocode_api(gmaps: googlemaps.Client, key: str) -> Tuple[float, float]:
+    """Call the Geocoding API for key and persist the result; raises _NoGeocodeResult on no results."""
+    results = gmaps.geocode(key)
+    if not results:
+        raise _NoGeocodeResult(key)
+    loc = results[0]["geometry"]["location"]
+    lat, lng = float(loc["lat"]), float(loc["lng"])
+    _geocode_cache_set(key, lat, lng)
+    return lat, lng
+
+
 def geocode_location(gmaps: googlemaps.Client, location: str) -> Optional[Dict[str, float]]:
     """
     Geocode a free-form location string to lat/lng.
+    Lookups are cached in-process and on disk (GEOCODE_CACHE_PATH), so repeat locations cost no API call.
     Returns dict with {'lat': float, 'lng': float} or None on failure/no results.
     """
     try:
-        results = gmaps.geocode(location)
-        if not results:
-            return None
-        loc = results[0]["geometry"]["location"]
-        return {"lat": float(loc["lat"]), "lng": float(loc["lng"])}
+        lat, lng = _geocode_lookup(gmaps, _normalize_location_key(location))
+        return {"lat": lat, "lng": lng}
+    except _NoGeocodeResult:
+        return None
     except (gme.Timeout, gme.TransportError) as e:
         print(f"[warn] Geocoding timeout/transport error: {e}", file=sys.stderr)
         return None
@@ -108,21 +450,53 @@ def geocode_location(gmaps: googlemaps.Client, location: str) -> Optional[Dict[s
         return None
 
 
+# Smallest delay between next_page_token retries (see _places_next_page).
+_PAGE_RETRY_MIN_WAIT = 0.1
+
+
+def _places_next_page(
+    gmaps: googlemaps.Client,
+    query: str,
+    page_token: str,
+    first_wait: float,
+    max_wait: float,
+) -> Dict:
+    """
+    Fetch the page behind a next_page_token, waiting only as long as the token needs.
+    Sleeps `first_wait` (0 = try immediately), then doubles the delay after each INVALID_REQUEST
+    (token not yet valid), starting from at least _PAGE_RETRY_MIN_WAIT, until `max_wait`;
+    any other error, or INVALID_REQUEST at `max_wait`, is re-raised.
+    """
+    delay = max(min(first_wait, max_wait), 0.0)
+    while True:
+        time.sleep(delay)
+        try:
+            return gmaps.places(query=query, page_token=page_token)
+        except gme.ApiError as e:
+            if e.status != "INVALID_REQUEST" or delay >= max_wait:
+                raise
+            # The floor keeps a zero/tiny first_wait from retrying in a tight loop forever.
+            delay = min(max(delay * 2, _PAGE_RETRY_MIN_WAIT), max_wait)
+
+
 def text_search_all_pages(
     gmaps: googlemaps.Client,
     query: str,
     location_latlng: Dict[str, float],
     radius: int = 5000,
     max_pages: int = 10,
-    page_wait_seconds: float = 2.0
-) -> List[Dict]:
+    page_wait_seconds: float = 2.0,
+    first_page_wait: float = 0.5,
+) -> List[str]:
     """
     Perform a Text Search for the query near the given lat/lng with a radius.
     Handles pagination (20 results per page) by following next_page_token until exhausted.
-    The Places API typically requires a short wait (~2s) before the next_page_token becomes valid.
-    Returns a list of raw result dicts (each having at least 'place_id').
+    The next_page_token needs a short warm-up before it becomes valid: each page is first tried
+    after `first_page_wait`, backing off (doubling) on INVALID_REQUEST up to `page_wait_seconds`.
+    Returns the unique place_ids in first-seen order (raw result dicts are not retained).
     """
-    all_results: List[Dict] = []
+    seen: Set[str] = set()
+    ordered: List[str] = []
     next_page_token: Optional[str] = None
     page = 0
 
@@ -130,9 +504,9 @@ def text_search_all_pages(
         page += 1
         try:
             if next_page_token:
-                # Next page: must wait a bit before using token per API docs.
-                time.sleep(page_wait_seconds)
-                resp = gmaps.places(query=query, page_token=next_page_token)
+                resp = _places_next_page(
+                    gmaps, query, next_page_token, first_page_wait, page_wait_seconds
+                )
             else:
                 resp = gmaps.places(
                     query=query,
@@ -145,7 +519,11 @@ def text_search_all_pages(
                 # No results on this page; stop.
                 break
 
-            all_results.extend(results)
+            for r in results:
+                pid = r.get("place_id")
+                if pid and pid not in seen:
+                    seen.add(pid)
+                    ordered.append(pid)
 
             next_page_token = resp.get("next_page_token")
             if not next_page_token:
@@ -168,83 +546,384 @@ def text_search_all_pages(
             print(f"[error] Unexpected error during Text Search: {e}", file=sys.stderr)
             break
 
-    return all_results
+    return ordered
 
 
-def get_leads_by_query(api_key: str, query: str, location: str, radius: int = 5000) -> List[Dict]:
+def _tile(
+    center_latlng: Dict[str, float], radius: int, n: int = 4
+) -> List[Tuple[float, float, int]]:
     """
-    Main orchestration function for your spec.
+    Split the square circumscribing the search circle into an n x n grid.
+    Returns (lat, lng, cell_radius) per cell; cell_radius reaches the cell corners so cells overlap
+    slightly rather than leaving gaps. Uses the local flat-earth approximation (~111,320 m per
+    degree of latitude), which is accurate enough at Text Search radii.
+    """
+    if n <= 1:
+        return [(center_latlng["lat"], center_latlng["lng"], radius)]
+
+    spacing = radius * 2 / n
+    cell_radius = int(math.ceil(spacing / 2 * math.sqrt(2)))
+    m_per_deg_lat = 111_320.0
+    m_per_deg_lng = m_per_deg_lat * max(math.cos(math.radians(center_latlng["lat"])), 1e-6)
+
+    cells: List[Tuple[float, float, int]] = []
+    for i in range(n):
+        dy = -radius + spacing * (i + 0.5)
+        for j in range(n):
+            dx = -radius + spacing * (j + 0.5)
+            cells.append((
+                center_latlng["lat"] + dy / m_per_deg_lat,
+                center_latlng["lng"] + dx / m_per_deg_lng,
+                cell_radius,
+            ))
+    return cells
+
+
+def search_place_ids(
+    gmaps: googlemaps.Client,
+    query: str,
+    location_latlng: Dict[str, float],
+    radius: int = 5000,
+    grid: int = 1,
+    concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+) -> List[str]:
+    """
+    Collect unique place_ids for the query around location_latlng.
+    With grid > 1 the area is split into grid x grid cells (see _tile) searched concurrently,
+    which lifts Text Search's ~60-results-per-query cap at the cost of grid^2 searches.
+    """
+    cells = _tile(location_latlng, radius, grid)
+    if len(cells) == 1:
+        return text_search_all_pages(
+            gmaps=gmaps, query=query, location_latlng=location_latlng, radius=radius
+        )
+
+    def search_cell(cell: Tuple[float, float, int]) -> List[str]:
+        lat, lng, cell_radius = cell
+        return text_search_all_pages(
+            gmaps=gmaps, query=query, location_latlng={"lat": lat, "lng": lng}, radius=cell_radius
+        )
+
+    seen: Set[str] = set()
+    ordered: List[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(cells)))) as ex:
+        # map() yields in cell order, keeping the merged order deterministic
+        for cell_ids in ex.map(search_cell, cells):
+            for pid in cell_ids:
+                if pid not in seen:
+                    seen.add(pid)
+                    ordered.append(pid)
+    return ordered
+
+
+def _fetch_detail(
+    gmaps: googlemaps.Client,
+    pid: str,
+    fields: List[str],
+) -> Optional[Dict]:
+    """
+    Fetch Place Details for a single place_id and sanitize it into a lead dict.
+    Returns None when the place has no result or the call failed (errors are logged, not raised).
+    """
+    try:
+        _PLACES_LIMITER.wait()
+        detail_resp = gmaps.place(place_id=pid, fields=fields)
+        result = (detail_resp or {}).get("result")
+        if not result:
+            return None
+        return lead_from_result(pid, result)
+
+    except gme.Timeout:
+        print(f"\n[warn] Details timeout for place_id={pid}; skipping.", file=sys.stderr)
+    except gme.ApiError as e:
+        print(f"\n[warn] Details API error for place_id={pid}: {e}; skipping.", file=sys.stderr)
+    except gme.TransportError as e:
+        print(f"\n[warn] Network/transport error for place_id={pid}: {e}; skipping.", file=sys.stderr)
+    except Exception as e:
+        print(f"\n[warn] Unexpected error for place_id={pid}: {e}; skipping.", file=sys.stderr)
+    return None
+
+
+def _iter_details_threaded(
+    gmaps: googlemaps.Client,
+    place_ids: List[str],
+    fields: List[str],
+    concurrency: int,
+    fetched: List[Dict],
+) -> Iterator[Dict]:
+    """
+    Fetch Place Details for all place_ids on a bounded thread pool, paced to PLACES_QPS,
+    yielding each lead as soon as its request completes (completion order, not input order).
+    Details calls are pure network wait, so overlapping them is what buys the speedup;
+    the client (and its requests.Session) is shared across worker threads.
+
+    Every lead obtained is also appended to `fetched`, including those still in flight or
+    not yet yielded when the consumer stops early, so the caller can cache all billed results.
+    """
+    total = len(place_ids)
+
+    ex = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        futures = {
+            ex.submit(_fetch_detail, gmaps, pid, fields): pid
+            for pid in place_ids
+        }
+        done = as_completed(futures)
+        if tqdm is not None:
+            # tqdm throttles its own redraws, so per-item updates stay cheap
+            done = tqdm(done, total=total, desc="Details", unit="place", leave=False)
+        for idx, fut in enumerate(done, start=1):
+            # Light progress indicator (every PROGRESS_EVERY items) when tqdm is unavailable
+            if tqdm is None and (idx % PROGRESS_EVERY == 0 or idx == total):
+                print(f"  - [{idx}/{total}] {futures[fut]}", end="\r", flush=True)
+            del futures[fut]
+            lead = fut.result()
+            if lead is not None:
+                fetched.append(lead)
+                yield lead
+    finally:
+        # If the consumer stops early, drop the requests that have not started yet; requests
+        # already in flight are billed anyway, so wait for them and keep their results too.
+        ex.shutdown(wait=True, cancel_futures=True)
+        for fut in futures:
+            if not fut.cancelled():
+                lead = fut.result()
+                if lead is not None:
+                    fetched.append(lead)
+
+
+async def _fetch_detail_async(
+    session: "aiohttp.ClientSession",
+    api_key: str,
+    pid: str,
+    fields: List[str],
+    sem: asyncio.Semaphore,
+) -> Optional[Dict]:
+    """
+    Async counterpart of _fetch_detail(): one raw GET against the Place Details endpoint.
+    Like the googlemaps client on the threaded path, retries up to HTTP_RETRIES times with
+    exponential backoff on HTTP_RETRY_STATUSES responses and OVER_QUERY_LIMIT.
+    Returns a lead dict, or None on no result / failure (errors are logged, not raised).
+    """
+    params = {"place_id": pid, "fields": ",".join(fields), "key": api_key}
+    for attempt in range(HTTP_RETRIES + 1):
+        if attempt:
+            # Back off outside the semaphore so other requests can use the slot meanwhile.
+            await asyncio.sleep(HTTP_RETRY_BACKOFF * 2 ** (attempt - 1))
+        retries_left = attempt < HTTP_RETRIES
+        try:
+            async with sem:
+                await _PLACES_LIMITER.wait_async()
+                async with session.get(PLACE_DETAILS_URL, params=params) as r:
+                    if r.status in HTTP_RETRY_STATUSES and retries_left:
+                        continue
+                    r.raise_for_status()
+                    body = await r.json()
+        except asyncio.TimeoutError:
+            print(f"\n[warn] Details timeout for place_id={pid}; skipping.", file=sys.stderr)
+            return None
+        except aiohttp.ClientResponseError as e:
+            # Not str(e): it includes the request URL, and with it the API key.
+            print(f"\n[warn] Details HTTP {e.status} for place_id={pid}: {e.message}; skipping.", file=sys.stderr)
+            return None
+        except aiohttp.ClientError as e:
+            print(f"\n[warn] Network/transport error for place_id={pid}: {e}; skipping.", file=sys.stderr)
+            return None
+        except Exception as e:
+            print(f"\n[warn] Unexpected error for place_id={pid}: {e}; skipping.", file=sys.stderr)
+            return None
+        if body.get("status") == "OVER_QUERY_LIMIT" and retries_left:
+            continue
+        break
+
+    status = body.get("status")
+    if status != "OK":
+        # Report exactly like the threaded path: googlemaps returns ZERO_RESULTS quietly and raises
+        # ApiError(status, error_message) for everything else (NOT_FOUND included).
+        if status != "ZERO_RESULTS":
+            e = gme.ApiError(status, body.get("error_message"))
+            print(f"\n[warn] Details API error for place_id={pid}: {e}; skipping.", file=sys.stderr)
+        return None
+    result = body.get("result")
+    if not result:
+        return None
+    return lead_from_result(pid, result)
+
+
+async def _fetch_details_async(
+    api_key: str,
+    place_ids: List[str],
+    fields: List[str],
+    concurrency: int,
+) -> List[Dict]:
+    """
+    Fetch Place Details for all place_ids on one event loop,
+    with at most `concurrency` requests in flight and pacing to PLACES_QPS.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+    connector = aiohttp.TCPConnector(limit=ASYNC_CONNECTION_LIMIT, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        results = await asyncio.gather(
+            *[_fetch_detail_async(session, api_key, pid, fields, sem) for pid in place_ids]
+        )
+    return [lead for lead in results if lead is not None]
+
+
+def fetch_details_async(
+    api_key: str,
+    place_ids: List[str],
+    fields: List[str],
+    concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+) -> List[Dict]:
+    """
+    Synchronous wrapper around the aiohttp Details backend (requires aiohttp).
+    Must not be called from a thread that already runs an event loop.
+    """
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is not installed; run `pip install aiohttp` to use the async backend.")
+    return asyncio.run(_fetch_details_async(api_key, place_ids, fields, concurrency))
+
+
+def iter_leads_by_query(
+    api_key: str,
+    query: str,
+    location: str,
+    radius: int = 5000,
+    detail_concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+    use_async: bool = False,
+    grid: int = 1,
+    on_place_ids: Optional[Callable[[List[str]], None]] = None,
+) -> Iterator[Dict]:
+    """
+    Streaming form of get_leads_by_query(): same steps, but yields each lead as soon as it is
+    available (cached leads first, then fetched ones in completion order), so a UI can render
+    partial results while Details calls are still in flight.
 
     1) Initialize client
     2) Geocode 'location' to lat/lng
     3) Text Search with pagination to collect place_ids
-    4) For each place_id, fetch cost-controlled Place Details
+       (over a `grid` x `grid` tiling of the area, searched concurrently, when grid > 1)
+    4) For each place_id not in the details cache, fetch cost-controlled Place Details
+       (up to `detail_concurrency` requests in flight, paced to PLACES_QPS;
+       on one asyncio event loop via aiohttp when `use_async` is set and aiohttp is installed)
+
+    `detail_concurrency` must not exceed HTTP_POOL_SIZE (extra workers would just wait for a connection).
+    `on_place_ids`, if given, is called once with the unique place_ids (in search order) before
+    any lead is yielded, e.g. to show "N of M" progress or to restore search order afterwards.
 
-    Returns a list of sanitized dicts with desired fields.
+    Yields sanitized dicts with desired fields.
     """
+    if detail_concurrency > HTTP_POOL_SIZE:
+        print(
+            f"[warn] detail_concurrency={detail_concurrency} exceeds HTTP_POOL_SIZE={HTTP_POOL_SIZE}; "
+            f"capping to {HTTP_POOL_SIZE}.",
+            file=sys.stderr,
+        )
+        detail_concurrency = HTTP_POOL_SIZE
+
     gmaps_client = init_client(api_key)
 
     print(f"[info] Geocoding location: {location}")
     latlng = geocode_location(gmaps_client, location)
     if not latlng:
         print("[error] Could not geocode the location; aborting.", file=sys.stderr)
-        return []
+        return
 
     print(f"[info] Starting Text Search for '{query}' within {radius}m of {location}...")
-    search_results = text_search_all_pages(
-        gmaps=gmaps_client, query=query, location_latlng=latlng, radius=radius
+    unique_place_ids = search_place_ids(
+        gmaps=gmaps_client,
+        query=query,
+        location_latlng=latlng,
+        radius=radius,
+        grid=grid,
+        concurrency=detail_concurrency,
     )
-    if not search_results:
+    if not unique_place_ids:
         print("[info] No search results found.")
-        return []
+        return
 
-    place_ids = [r.get("place_id") for r in search_results if r.get("place_id")]
-    unique_place_ids = list(dict.fromkeys(place_ids))  # preserve order, remove dupes
     print(f"[info] Found {len(unique_place_ids)} unique places. Fetching details...")
+    if on_place_ids is not None:
+        on_place_ids(unique_place_ids)
 
-    # Fields matter for cost control:
+    # Fields matter for cost control: request only what lead_from_result() reads.
+    # All are Basic SKU except formatted_phone_number/website (Contact SKU).
+    # Note: the field is "type" here but comes back as "types" in the result.
     fields = [
-        'rating', 'geometry/viewport/northeast', 'geometry/location/lat', 'serves_wine', 'website', 'formatted_address', 'adr_address', 'reservable', 'formatted_phone_number', 'geometry/location/lng', 'address_component', 'editorial_summary', 'geometry', 'business_status', 'reviews', 'utc_offset', 'geometry/viewport/southwest', 'serves_lunch', 'secondary_opening_hours', 'review', 'geometry/viewport/northeast/lng', 'geometry/viewport/northeast/lat', 'type', 'wheelchair_accessible_entrance', 'price_level', 'delivery', 'takeout', 'serves_breakfast', 'serves_beer', 'opening_hours', 'serves_vegetarian_food', 'dine_in', 'place_id', 'photo', 'international_phone_number', 'current_opening_hours', 'curbside_pickup', 'geometry/viewport/southwest/lng', 'user_ratings_total', 'vicinity', 'icon', 'url', 'geometry/location', 'name', 'geometry/viewport/southwest/lat', 'serves_brunch', 'geometry/viewport', 'plus_code', 'serves_dinner', 'permanently_closed'
+        "place_id",
+        "name",
+        "formatted_address",
+        "formatted_phone_number",
+        "website",
+        "url",
+        "type",
+        "business_status",
     ]
 
-    leads: List[Dict] = []
+    fhash = _fields_hash(fields)
+    cached = _details_cache_get_many(unique_place_ids, fhash)
+    missing = [pid for pid in unique_place_ids if pid not in cached]
+    if cached:
+        print(f"[info] {len(cached)} places served from the details cache; fetching {len(missing)}...")
 
-    for idx, pid in enumerate(unique_place_ids, start=1):
-        # Light progress indicator
-        print(f"  - [{idx}/{len(unique_place_ids)}] {pid}", end="\r", flush=True)
+    if use_async and aiohttp is None:
+        print("[warn] aiohttp is not installed; falling back to the thread pool.", file=sys.stderr)
+        use_async = False
 
-        try:
-            detail_resp = gmaps_client.place(place_id=pid, fields=fields)
-            result = (detail_resp or {}).get("result")
-            if not result:
-                continue
+    for pid in unique_place_ids:
+        if pid in cached:
+            yield cached[pid]
 
-            # Sanitize fields
-            lead = {
-                "place_id": pid,
-                "name": safe_get_str(result, "name"),
-                "formatted_address": safe_get_str(result, "formatted_address"),
-                "formatted_phone_number": safe_get_str(result, "formatted_phone_number"),
-                "website": safe_get_str(result, "website"),
-                "url": safe_get_str(result, "url"),  # Google Maps place URL
-                "types": "|".join(result.get("types", []) or []),
-                "business_status": safe_get_str(result, "business_status"),
-            }
-            leads.append(lead)
+    fetched: List[Dict] = []
+    try:
+        if missing and use_async:
+            # asyncio.run() cannot be suspended mid-gather, so the async backend yields as one batch.
+            fetched = fetch_details_async(api_key, missing, fields, detail_concurrency)
+            yield from fetched
+        elif missing:
+            yield from _iter_details_threaded(
+                gmaps_client, missing, fields, detail_concurrency, fetched
+            )
+    finally:
+        # Persist whatever was fetched, even if the consumer stopped early.
+        _details_cache_put_many(fetched, fhash)
 
-        except gme.Timeout:
-            print(f"\n[warn] Details timeout for place_id={pid}; skipping.", file=sys.stderr)
-        except gme.ApiError as e:
-            print(f"\n[warn] Details API error for place_id={pid}: {e}; skipping.", file=sys.stderr)
-        except gme.TransportError as e:
-            print(f"\n[warn] Network/transport error for place_id={pid}: {e}; skipping.", file=sys.stderr)
-        except Exception as e:
-            print(f"\n[warn] Unexpected error for place_id={pid}: {e}; skipping.", file=sys.stderr)
+    print("\n[info] Done fetching details.")
 
-        # Gentle pacing to avoid hammering the API (adjust if needed)
-        time.sleep(0.05)
 
-    print("\n[info] Done fetching details.")
+def get_leads_by_query(
+    api_key: str,
+    query: str,
+    location: str,
+    radius: int = 5000,
+    detail_concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+    use_async: bool = False,
+    grid: int = 1,
+) -> List[Dict]:
+    """
+    Main orchestration function for your spec.
+
+    1) Initialize client
+    2) Geocode 'location' to lat/lng
+    3) Text Search with pagination to collect place_ids
+    4) Fetch cost-controlled Place Details for each place_id
+
+    See iter_leads_by_query() for the parameters and a streaming variant.
+    Returns a list of sanitized dicts with desired fields, in Text Search (relevance) order.
+    """
+    order: Dict[str, int] = {}
+
+    def remember_order(place_ids: List[str]) -> None:
+        order.update((pid, i) for i, pid in enumerate(place_ids))
+
+    leads = list(iter_leads_by_query(
+        api_key, query, location, radius,
+        detail_concurrency=detail_concurrency, use_async=use_async, grid=grid,
+        on_place_ids=remember_order,
+    ))
+    # The stream arrives in completion order; batch callers get the deterministic search order.
+    leads.sort(key=lambda lead: order[lead["place_id"]])
     return leads
 
 
@@ -252,15 +931,28 @@ def get_leads_by_query(api_key: str, query: str, location: str, radius: int = 50
 # 3) Data Extraction Helpers
 # -------------------------------
 
-def safe_get_str(d: Dict, key: str) -> str:
+# Lead fields copied straight from the Details result (Google returns them as strings or omits them).
+_LEAD_STR_FIELDS = (
+    "name",
+    "formatted_address",
+    "formatted_phone_number",
+    "website",
+    "url",  # Google Maps place URL
+    "business_status",
+)
+
+
+def lead_from_result(pid: str, result: Dict) -> Dict:
     """
-    Return a string value for d[key] or empty string if missing/non-string.
-    Prevents KeyErrors and ensures CSV-safe values.
+    Sanitize a Place Details 'result' object into the flat lead dict written to CSV/JSON.
+    Missing/None values become empty strings so rows stay CSV-safe.
     """
-    v = d.get(key, "")
-    if v is None:
-        return ""
-    return str(v)
+    get = result.get
+    lead = {k: (get(k) or "") for k in _LEAD_STR_FIELDS}
+    lead["place_id"] = pid
+    types_val = get("types")
+    lead["types"] = "|".join(types_val) if types_val else ""
+    return lead
 
 
 # -------------------------------
@@ -274,9 +966,9 @@ def sanitize_filename_fragment(text: str) -> str:
     - Keep alphanumerics and underscore
     - Trim consecutive underscores
     """
-    text = re.sub(r"\s+", "_", text.strip())
-    text = re.sub(r"[^A-Za-z0-9_]+", "", text)
-    text = re.sub(r"_+", "_", text)
+    text = _WS_RE.sub("_", text.strip())
+    text = _NONALNUM_RE.sub("", text)
+    text = _DUP_US_RE.sub("_", text)
     return text.strip("_") or "search"
 
 
@@ -304,17 +996,23 @@ def write_csv(path: str, rows: List[Dict]) -> None:
         "types",
         "business_status",
     ]
+    # Build plain tuples up front so writerows() runs without per-row DictWriter lookups.
+    rows_t = [tuple(r.get(k, "") for k in fieldnames) for r in rows]
     with open(path, "w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows_t)
 
 
 def write_json(path: str, rows: List[Dict]) -> None:
     """
     Write leads to JSON (UTF-8) for easy integration.
+    Uses orjson when installed (same 2-space indented output, much faster encoding).
     """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(rows, f, ensure_ascii=False, indent=2)
 
@@ -332,6 +1030,14 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--radius", type=int, default=5000, help="Search radius in meters (default: 5000)")
     p.add_argument("--json-only", action="store_true", help="Write only JSON (skip CSV)")
     p.add_argument("--csv-only", action="store_true", help="Write only CSV (skip JSON)")
+    p.add_argument(
+        "--grid", type=int, default=1,
+        help="Split the area into an N x N grid of Text Searches to get past the ~60 result cap (default: 1)"
+    )
+    p.add_argument(
+        "--async", dest="use_async", action="store_true",
+        help="Fetch Place Details with asyncio + aiohttp instead of a thread pool (requires aiohttp)"
+    )
     return p.parse_args()
 
 
@@ -358,7 +1064,9 @@ def main() -> None:
     print("[info] API key loaded successfully.")
     print(f"[info] Query: '{args.query}' | Location: '{args.location}' | Radius: {args.radius}m")
 
-    leads = get_leads_by_query(api_key, args.query, args.location, args.radius)
+    leads = get_leads_by_query(
+        api_key, args.query, args.location, args.radius, use_async=args.use_async, grid=args.grid
+    )
     if not leads:
         print("[info] No leads to write. Exiting.")
         return
@@ -6,20 +6,23 @@ Assumptions:
 - Core scraping lives in `lead_scraper.py` in the same folder.
 - `lead_scraper.py` exposes:
     - load_api_key() -> Optional[str]
-    - get_leads_by_query(api_key: str, query: str, location: str, radius: int = 5000) -> List[Dict]
+    - iter_leads_by_query(api_key: str, query: str, location: str, radius: int = 5000) -> Iterator[Dict]
 - API key handling (env/.env/config.ini) is done inside lead_scraper.py
 
 Run:
     streamlit run app_streamlit.py
 """
 
-from typing import List, Dict
+import re
+import threading
+import time
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import streamlit as st
 
 # Import from your scraper module (same folder)
 # Make sure your file is named exactly 'lead_scraper.py'
-from lead_gen import load_api_key, get_leads_by_query
+from lead_gen import load_api_key, iter_leads_by_query
 
 # -------------------------------
 # Page Config & Title
@@ -44,28 +47,115 @@ results_container = st.container()
 # -------------------------------
 # Helpers
 # -------------------------------
+_WS_RE = re.compile(r"\s+")
+_NONALNUM_RE = re.compile(r"[^A-Za-z0-9_]+")
+_DUP_US_RE = re.compile(r"_+")
+
+# Finished searches are reused for this long (seconds); at most this many are kept.
+SEARCH_CACHE_TTL_SECONDS = 3600
+SEARCH_CACHE_MAX_ENTRIES = 100
+
+# Minimum seconds between re-renders of the live results table while a search runs.
+LIVE_RENDER_INTERVAL = 0.25
+
+# The progress bar is advanced once per this many received leads.
+PROGRESS_EVERY = 5
+
+# Lead columns in the order the UI (and the CSV download) shows them.
+DISPLAY_COLUMNS = [
+    "name",
+    "formatted_address",
+    "formatted_phone_number",
+    "website",
+    "url",
+    "place_id",
+    "types",
+    "business_status",
+]
+
+
 def to_dataframe(leads: List[Dict]) -> pd.DataFrame:
     """
     Convert list of lead dicts into a tidy DataFrame for display & download.
-    Expects keys from Place Details: name, formatted_address, formatted_phone_number, website, url
+    Leads share a fixed schema, so columns are built directly (no per-row schema inference),
+    in a friendly display order and as pandas string dtype.
+    """
+    data = {c: [r.get(c, "") for r in leads or []] for c in DISPLAY_COLUMNS}
+    return pd.DataFrame(data, columns=DISPLAY_COLUMNS, dtype="string")
+
+
+@st.cache_resource
+def _search_cache() -> Tuple[Dict[Tuple[str, str, int], Tuple[float, List[Dict]]], threading.Lock]:
+    """
+    Process-wide store of finished searches: (query, location, radius) -> (timestamp, leads),
+    plus the lock guarding it (sessions run on separate threads).
+    Repeat searches within SEARCH_CACHE_TTL_SECONDS skip all API traffic; the API key is not part of the key.
+    (A plain st.cache_data function can't be used here because the results are streamed as they arrive.)
+    """
+    return {}, threading.Lock()
+
+
+def _search_cache_get(key: Tuple[str, str, int]) -> Optional[List[Dict]]:
+    """Return a copy of the cached leads for key, or None if absent/expired."""
+    store, lock = _search_cache()
+    with lock:
+        hit = store.get(key)
+        if hit is None:
+            return None
+        if time.time() - hit[0] >= SEARCH_CACHE_TTL_SECONDS:
+            del store[key]
+            return None
+        return list(hit[1])
+
+
+def _search_cache_put(key: Tuple[str, str, int], leads: List[Dict]) -> None:
+    """Store a copy of leads, first evicting expired entries and then the oldest beyond the size cap."""
+    store, lock = _search_cache()
+    now = time.time()
+    with lock:
+        for k in [k for k, (ts, _) in store.items() if now - ts >= SEARCH_CACHE_TTL_SECONDS]:
+            del store[k]
+        while store and len(store) >= SEARCH_CACHE_MAX_ENTRIES:
+            del store[min(store, key=lambda k: store[k][0])]
+        store[key] = (now, list(leads))
+
+
+def stream_leads(api_key: str, query: str, location: str, radius: int, table, progress) -> List[Dict]:
+    """
+    Run the search, re-rendering the partial results into `table` (an st.empty placeholder)
+    at most every LIVE_RENDER_INTERVAL seconds so the UI does not thrash, and an "N of M places"
+    bar into `progress` (another st.empty placeholder) every PROGRESS_EVERY leads. Returns all leads.
     """
-    df = pd.DataFrame(leads or [])
-    # Ensure the UI shows these columns in a friendly order if present
-    desired_order = [
-        "name",
-        "formatted_address",
-        "formatted_phone_number",
-        "website",
-        "url",
-        "place_id",
-        "types",
-        "business_status",
-    ]
-    # Keep only columns that exist, in the desired order
-    cols = [c for c in desired_order if c in df.columns]
-    if cols:
-        df = df[cols]
-    return df
+    key = (query, location, radius)
+    hit = _search_cache_get(key)
+    if hit is not None:
+        return hit
+
+    leads: List[Dict] = []
+    total = 0
+    last_draw = 0.0
+
+    def set_total(place_ids: List[str]) -> None:
+        nonlocal total
+        total = len(place_ids)
+        progress.progress(0.0, text=f"Fetched 0 of {total} places")
+
+    for lead in iter_leads_by_query(
+        api_key=api_key, query=query, location=location, radius=radius, on_place_ids=set_total
+    ):
+        leads.append(lead)
+        if total and (len(leads) % PROGRESS_EVERY == 0 or len(leads) == total):
+            progress.progress(min(len(leads) / total, 1.0), text=f"Fetched {len(leads)} of {total} places")
+        now = time.monotonic()
+        if now - last_draw >= LIVE_RENDER_INTERVAL:
+            table.dataframe(to_dataframe(leads), use_container_width=True)
+            last_draw = now
+    progress.empty()
+    table.empty()
+
+    if leads:
+        _search_cache_put(key, leads)
+    return leads
 
 
 def csv_bytes(df: pd.DataFrame) -> bytes:
@@ -75,11 +165,10 @@ def csv_bytes(df: pd.DataFrame) -> bytes:
 
 def sanitize_fragment(text: str) -> str:
     """Simple filename fragment sanitizer for query/location."""
-    import re
     text = (text or "").strip()
-    text = re.sub(r"\s+", "_", text)
-    text = re.sub(r"[^A-Za-z0-9_]+", "", text)
-    text = re.sub(r"_+", "_", text)
+    text = _WS_RE.sub("_", text)
+    text = _NONALNUM_RE.sub("", text)
+    text = _DUP_US_RE.sub("_", text)
     return text.strip("_") or "search"
 
 
@@ -97,7 +186,9 @@ if start_btn:
         with st.spinner("Scraping in progress... This may take a moment."):
             try:
                 status_box.info(f"Searching for **{query}** around **{location}** (radius {radius} m)…")
-                leads = get_leads_by_query(api_key=api_key, query=query, location=location, radius=int(radius))
+                live_progress = results_container.empty()
+                live_table = results_container.empty()
+                leads = stream_leads(api_key, query, location, int(radius), live_table, live_progress)
 
                 if not leads:
                     st.error("No results found or an error occurred. Try a broader query, larger radius, or another location.")